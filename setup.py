@@ -9,13 +9,24 @@ PLIST = {
     'CFBundleVersion': '1.0.0',
     'CFBundleShortVersionString': '1.0.0',
     'LSUIElement': True,  # menu bar app, no Dock icon
+    # Services menu entry; the selection arrives on a pasteboard, no Cmd+C needed
+    'NSServices': [{
+        'NSMenuItem': {'default': 'Speak with read4me'},
+        'NSMessage': 'speakSelection',
+        'NSPortName': 'read4me',
+        'NSSendTypes': ['public.utf8-plain-text'],
+        'NSRequiredContext': {},  # enabled by default instead of off until the user opts in
+    }],
 }
 OPTIONS = {
     'argv_emulation': False,
     'iconfile': 'assets/read4me.icns',   # optional
     'plist': PLIST,
-    'packages': ['rumps', 'pyperclip', 'pynput'],
-    'includes': ['rumps', 'pyperclip', 'pynput'],
+    'includes': ['rumps'],
+    'excludes': ['tkinter', 'test', 'unittest', 'pydoc', 'distutils'],
+    'optimize': 2,  # strip asserts and docstrings from the bundled bytecode
+    'strip': True,
+    'semi_standalone': False,
 }
 
 setup(
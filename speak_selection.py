@@ -6,13 +6,14 @@ Features
   - Global hotkeys to speak the current selection and stop speaking
   - Menu bar toggle to enable/disable hotkeys
   - Menu item linking to documentation/how-to-use
+  - "Speak with read4me" Services menu item (app bundle only)
 
 Hotkeys
   - Cmd+Shift+S : Copy current selection and speak it
   - Cmd+Shift+X : Stop speaking
 
 Requirements
-  pip install rumps pynput pyperclip
+  pip install rumps pyobjc
 
 macOS Setup
   - Allow your terminal/IDE in System Settings → Privacy & Security → Accessibility
@@ -25,17 +26,20 @@ Notes
 
 from __future__ import annotations
 
+import ctypes
+import queue
+import re
 import subprocess
 import sys
 import time
 import threading
-import webbrowser
 from typing import Optional
 
-import pyperclip
+import objc
 import rumps
-from pynput import keyboard
-from pynput.keyboard import Key, Controller
+from AppKit import NSApplication, NSObject, NSPasteboard, NSPasteboardTypeString
+from PyObjCTools import AppHelper
+from Quartz import CGEventCreateKeyboardEvent, CGEventPost, CGEventSetFlags, kCGEventFlagMaskCommand, kCGHIDEventTap
 
 # macOS Accessibility (pyobjc)
 try:
@@ -46,14 +50,93 @@ except Exception:
     kAXTrustedCheckOptionPrompt = None
     NSDictionary = None
 
+try:
+    from ApplicationServices import (
+        AXUIElementCopyAttributeValue,
+        AXUIElementCreateSystemWide,
+        AXUIElementSetMessagingTimeout,
+        kAXErrorSuccess,
+        kAXFocusedUIElementAttribute,
+        kAXSelectedTextAttribute,
+    )
+except Exception:
+    AXUIElementCreateSystemWide = None
+
 # ---- Config ----
 DEFAULT_RATE_WPM: int = 190
 DEFAULT_VOICE: Optional[str] = None  # e.g., "Samantha", "Alex"
-COPY_DELAY_SEC: float = 0.30
+COPY_DELAY_SEC: float = 0.30  # upper bound on waiting for the app to copy
+COPY_POLL_SEC: float = 0.005
+RESTORE_CLIPBOARD: bool = False  # put the user's clipboard back after copying the selection
+RESTORE_SETTLE_SEC: float = 0.05  # let the app finish writing its other formats before restoring
+AX_TIMEOUT_SEC: float = 0.15  # give up on a hung app and fall back to Cmd+C
 DOCS_URL: str = "https://github.com/codewithbro95/read4me"  # Update to your repo
 APP_TITLE_ENABLED = "🗣️ r4me"
 APP_TITLE_DISABLED = "r4me"
 
+# Sentence streaming: split on terminal punctuation followed by a new sentence
+# (compiled once at import; speak() runs it on every selection)
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'])")
+SENTENCE_ABBREVIATIONS = frozenset({
+    "Dr.", "Mr.", "Mrs.", "Ms.", "St.", "Prof.", "Sr.", "Jr.",
+    "vs.", "etc.", "e.g.", "i.e.", "AM.", "PM.",
+})
+MIN_SENTENCE_CHARS: int = 10
+
+
+# ---- Carbon hotkeys ----
+# PyObjC does not wrap RegisterEventHotKey, so call HIToolbox through ctypes.
+def _fourcc(code: str) -> int:
+    return int.from_bytes(code.encode("ascii"), "big")
+
+
+class EventHotKeyID(ctypes.Structure):
+    _fields_ = [("signature", ctypes.c_uint32), ("id", ctypes.c_uint32)]
+
+
+class EventTypeSpec(ctypes.Structure):
+    _fields_ = [("eventClass", ctypes.c_uint32), ("eventKind", ctypes.c_uint32)]
+
+
+EventHandlerProc = ctypes.CFUNCTYPE(ctypes.c_int32, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
+
+kEventClassKeyboard = _fourcc("keyb")
+kEventHotKeyPressed = 5
+kEventParamDirectObject = _fourcc("----")
+typeEventHotKeyID = _fourcc("hkid")
+noErr = 0
+eventNotHandledErr = -9874
+cmdKey = 1 << 8
+shiftKey = 1 << 9
+kVK_ANSI_S = 0x01
+kVK_ANSI_X = 0x07
+kVK_ANSI_C = 0x08
+
+HOTKEY_SIGNATURE = _fourcc("r4me")
+SPEAK_HOTKEY = (kVK_ANSI_S, cmdKey | shiftKey)  # Cmd+Shift+S
+STOP_HOTKEY = (kVK_ANSI_X, cmdKey | shiftKey)   # Cmd+Shift+X
+
+_carbon = ctypes.cdll.LoadLibrary("/System/Library/Frameworks/Carbon.framework/Carbon")
+_carbon.GetApplicationEventTarget.argtypes = []
+_carbon.GetApplicationEventTarget.restype = ctypes.c_void_p
+_carbon.InstallEventHandler.argtypes = [
+    ctypes.c_void_p, EventHandlerProc, ctypes.c_ulong,
+    ctypes.POINTER(EventTypeSpec), ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p),
+]
+_carbon.InstallEventHandler.restype = ctypes.c_int32
+_carbon.RegisterEventHotKey.argtypes = [
+    ctypes.c_uint32, ctypes.c_uint32, EventHotKeyID,
+    ctypes.c_void_p, ctypes.c_uint32, ctypes.POINTER(ctypes.c_void_p),
+]
+_carbon.RegisterEventHotKey.restype = ctypes.c_int32
+_carbon.UnregisterEventHotKey.argtypes = [ctypes.c_void_p]
+_carbon.UnregisterEventHotKey.restype = ctypes.c_int32
+_carbon.GetEventParameter.argtypes = [
+    ctypes.c_void_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p,
+    ctypes.c_ulong, ctypes.c_void_p, ctypes.c_void_p,
+]
+_carbon.GetEventParameter.restype = ctypes.c_int32
+
 
 def is_accessibility_trusted(prompt: bool = False) -> bool:
     """Return True if the app has macOS Accessibility permission. If prompt=True, show the system prompt."""
@@ -71,34 +154,109 @@ def is_accessibility_trusted(prompt: bool = False) -> bool:
         return True
 
 
+def find_voice(name: str):
+    """Look up an installed voice by name (as used by 'say -v') or identifier."""
+    from AVFoundation import AVSpeechSynthesisVoice
+
+    for v in AVSpeechSynthesisVoice.speechVoices():
+        if name in (v.name(), v.identifier()):
+            return v
+    print(f"[info] Voice '{name}' not found, using the system default.")
+    return None
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences, keeping abbreviations and short fragments attached."""
+    sentences: list[str] = []
+    buf = ""
+    for part in SENTENCE_BOUNDARY.split(text):
+        buf = f"{buf} {part}" if buf else part
+        tail = buf.rsplit(None, 1)
+        last_word = tail[-1] if tail else ""
+        if len(buf) < MIN_SENTENCE_CHARS or last_word in SENTENCE_ABBREVIATIONS:
+            continue
+        sentences.append(buf)
+        buf = ""
+    if buf and not buf.isspace():
+        sentences.append(buf)
+    return sentences
+
+
 class TextSpeaker:
-    """Handles reading text with macOS 'say' and managing the speaking process."""
+    """Reads text aloud with the in-process macOS speech synthesizer.
+
+    AVSpeechSynthesizer loads the voice and audio graph once, so each utterance
+    is a single Objective-C call rather than a fresh 'say' process. AVFoundation
+    is only imported on the first speak() to keep it off the app's start-up path.
+    """
 
     def __init__(self, rate_wpm: int = DEFAULT_RATE_WPM, voice: Optional[str] = DEFAULT_VOICE):
-        self._proc: Optional[subprocess.Popen] = None
-        self.rate_wpm = rate_wpm
-        self.voice = voice
+        self._syn = None
+        self._rate: Optional[float] = None  # resolved on the next speak()
+        self._av_voice = None
+        self._rate_wpm = rate_wpm
+        self._voice = voice
         self._lock = threading.Lock()
 
+    @property
+    def rate_wpm(self) -> int:
+        return self._rate_wpm
+
+    @rate_wpm.setter
+    def rate_wpm(self, value: int) -> None:
+        self._rate_wpm = value
+        self._settings_changed()
+
+    @property
+    def voice(self) -> Optional[str]:
+        return self._voice
+
+    @voice.setter
+    def voice(self, value: Optional[str]) -> None:
+        self._voice = value
+        self._settings_changed()
+
+    def _settings_changed(self) -> None:
+        # Under the lock so a concurrent _prepare_locked never mixes old and new settings
+        with self._lock:
+            self._rate = None
+
+    def _prepare_locked(self) -> None:
+        """Create the synthesizer and translate rate/voice once, not per utterance."""
+        from AVFoundation import (
+            AVSpeechSynthesizer,
+            AVSpeechUtteranceDefaultSpeechRate,
+            AVSpeechUtteranceMaximumSpeechRate,
+            AVSpeechUtteranceMinimumSpeechRate,
+        )
+
+        if self._syn is None:
+            self._syn = AVSpeechSynthesizer.alloc().init()
+        if self._rate is None:
+            # The default utterance rate roughly matches 'say -r 200'
+            rate = self._rate_wpm / 200.0 * AVSpeechUtteranceDefaultSpeechRate
+            self._rate = min(max(rate, AVSpeechUtteranceMinimumSpeechRate), AVSpeechUtteranceMaximumSpeechRate)
+            self._av_voice = find_voice(self._voice) if self._voice else None
+
     def speak(self, text: str) -> None:
-        """Start speaking the given text, stopping any existing speech."""
-        text = (text or "").strip()
+        """Start speaking the given (already stripped) text, stopping any existing speech."""
         if not text:
             print("[info] No text selected.")
             return
 
+        from AVFoundation import AVSpeechUtterance
+
         with self._lock:
+            self._prepare_locked()
             self._stop_locked()
 
-            cmd = ["say", "-r", str(self.rate_wpm)]
-            if self.voice:
-                cmd += ["-v", self.voice]
-
-            # Use stdin to avoid shell quoting limits
-            self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
-            assert self._proc.stdin is not None
-            self._proc.stdin.write(text.encode("utf-8", errors="ignore"))
-            self._proc.stdin.close()
+            # Queue one utterance per sentence so speech starts after the first
+            for sentence in split_sentences(text):
+                utterance = AVSpeechUtterance.speechUtteranceWithString_(sentence)
+                utterance.setRate_(self._rate)
+                if self._av_voice is not None:
+                    utterance.setVoice_(self._av_voice)
+                self._syn.speakUtterance_(utterance)
 
         print("[speak] Reading selection...")
 
@@ -107,80 +265,108 @@ class TextSpeaker:
             self._stop_locked()
 
     def _stop_locked(self) -> None:
-        if self._proc and self._proc.poll() is None:
-            try:
-                self._proc.terminate()
-            except Exception:
-                pass
-        self._proc = None
+        if self._syn is not None and self._syn.isSpeaking():
+            from AVFoundation import AVSpeechBoundaryImmediate
+
+            self._syn.stopSpeakingAtBoundary_(AVSpeechBoundaryImmediate)
         print("[stop] Stopped.")
 
 
 class SelectionReader:
-    """Copies current selection via Cmd+C and returns clipboard contents."""
+    """Reads the current selection via Accessibility, falling back to Cmd+C and the pasteboard."""
 
-    def __init__(self, copy_delay_sec: float = COPY_DELAY_SEC):
-        self.kbd = Controller()
+    def __init__(self, copy_delay_sec: float = COPY_DELAY_SEC, restore_clipboard: bool = RESTORE_CLIPBOARD):
         self.copy_delay_sec = copy_delay_sec
+        self.restore_clipboard = restore_clipboard
+        self.pb = NSPasteboard.generalPasteboard()
+        self._ax_system = None
+        if AXUIElementCreateSystemWide is not None:
+            self._ax_system = AXUIElementCreateSystemWide()
+            # The system default is ~6 s per call; a hung app must not stall the worker
+            AXUIElementSetMessagingTimeout(self._ax_system, AX_TIMEOUT_SEC)
+
+    def _read_accessibility_selection(self) -> str:
+        """Return the focused element's selected text, or "" if the app does not expose it.
+
+        Any AX error, including kAXErrorCannotComplete on timeout, falls back to Cmd+C.
+        """
+        if self._ax_system is None:
+            return ""
+        try:
+            err, focused = AXUIElementCopyAttributeValue(self._ax_system, kAXFocusedUIElementAttribute, None)
+            if err != kAXErrorSuccess or focused is None:
+                return ""
+            err, selected = AXUIElementCopyAttributeValue(focused, kAXSelectedTextAttribute, None)
+            if err != kAXErrorSuccess or not selected:
+                return ""
+            return str(selected)
+        except Exception:
+            return ""
+
+    def _read_pasteboard(self) -> str:
+        return self.pb.stringForType_(NSPasteboardTypeString) or ""
+
+    def _write_pasteboard(self, text: str) -> None:
+        self.pb.clearContents()
+        self.pb.setString_forType_(text, NSPasteboardTypeString)
+
+    @staticmethod
+    def _post_cmd_c() -> None:
+        # Flags are set explicitly, so the still-held Shift of the hotkey is not included
+        for key_down in (True, False):
+            event = CGEventCreateKeyboardEvent(None, kVK_ANSI_C, key_down)
+            CGEventSetFlags(event, kCGEventFlagMaskCommand)
+            CGEventPost(kCGHIDEventTap, event)
+
+    def _wait_for_text(self, start_count: int) -> bool:
+        """Poll until the pasteboard has changed and holds a string, or copy_delay_sec elapses.
+
+        The change count moves on the app's clearContents, before any data is
+        written, and Chromium/Electron write plain text as a separate later call.
+        """
+        deadline = time.monotonic() + self.copy_delay_sec
+        while self.pb.changeCount() == start_count or self.pb.stringForType_(NSPasteboardTypeString) is None:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(COPY_POLL_SEC)
+        return True
 
     def copy_selection_to_clipboard(self) -> str:
         """
-        Clear clipboard, issue Cmd+C to copy the current selection, wait,
-        read clipboard, then restore previous clipboard.
+        Return the selected text straight from Accessibility when the focused
+        element exposes it. Otherwise issue Cmd+C, wait for the pasteboard to
+        change and read it; if restore_clipboard is set, put back the previous
+        contents afterwards. The returned text is stripped.
         """
-        # Save clipboard and clear it so we do not read stale content
-        try:
-            prev_clip = pyperclip.paste()
-        except pyperclip.PyperclipException:
-            prev_clip = ""
-        try:
-            pyperclip.copy("")  # clear
-        except pyperclip.PyperclipException:
-            pass
+        text = self._read_accessibility_selection().strip()
+        if text:
+            return text
+
+        # Any change after this point is fresh content from the Cmd+C
+        prev_clip = self._read_pasteboard() if self.restore_clipboard else ""
+        start_count = self.pb.changeCount()
 
         # Small pause to let hotkey modifiers settle
         time.sleep(0.05)
 
         # Press Cmd+C to copy current selection
-        with self._pressed(Key.cmd):
-            self.kbd.press('c')
-            self.kbd.release('c')
+        self._post_cmd_c()
 
-        # Wait for the app to place data on the clipboard
-        time.sleep(self.copy_delay_sec)
+        # Return as soon as the app has placed text on the pasteboard
+        if not self._wait_for_text(start_count):
+            # No text was copied, e.g. no selection. Do not restore: the app
+            # may still be mid-write and clearing now would mix the contents.
+            return ""
+        text = self._read_pasteboard()
 
-        # Try read, retry once if still empty (some apps are slower)
-        text = ""
-        try:
-            text = pyperclip.paste()
-        except pyperclip.PyperclipException:
-            text = ""
-
-        if not text.strip():
-            time.sleep(0.20)
-            try:
-                text = pyperclip.paste()
-            except pyperclip.PyperclipException:
-                text = ""
+        # Restore previous pasteboard content (do not disturb user's clipboard).
+        # Only once the string has landed, and after a short settle so the
+        # app's remaining formats are written before we clear the pasteboard.
+        if self.restore_clipboard and prev_clip != text:
+            time.sleep(RESTORE_SETTLE_SEC)
+            self._write_pasteboard(prev_clip)
 
-        # Restore previous clipboard content (do not disturb user's clipboard)
-        try:
-            pyperclip.copy(prev_clip)
-        except pyperclip.PyperclipException:
-            pass
-
-        return text or ""
-
-    from contextlib import contextmanager
-
-    @contextmanager
-    def _pressed(self, key):
-        """Context manager to press and release a modifier key cleanly."""
-        self.kbd.press(key)
-        try:
-            yield
-        finally:
-            self.kbd.release(key)
+        return text.strip()
 
 
 class HotkeyDebouncer:
@@ -188,57 +374,134 @@ class HotkeyDebouncer:
 
     def __init__(self, min_interval_sec: float = 0.5):
         self.min_interval = min_interval_sec
-        self._last = 0.0
-        self._lock = threading.Lock()
+        self._last = 0
+
+    @property
+    def min_interval(self) -> float:
+        return self._min_ns / 1e9
+
+    @min_interval.setter
+    def min_interval(self, value: float) -> None:
+        self._min_ns = int(value * 1e9)
 
     def ok(self) -> bool:
-        now = time.time()
-        with self._lock:
-            if now - self._last < self.min_interval:
-                return False
-            self._last = now
-            return True
+        # Only called from the hotkey handler; a lost race at worst
+        # lets one extra press through, so no lock is needed.
+        now = time.monotonic_ns()
+        if now - self._last < self._min_ns:
+            return False
+        self._last = now
+        return True
 
 
 class HotkeyService:
-    """Manages a background GlobalHotKeys listener that can be toggled on/off."""
+    """Registers Carbon global hotkeys on the main run loop that can be toggled on/off.
+
+    The handler only fires for the exact registered combinations, so no
+    Python code runs for ordinary keystrokes.
+    """
+
+    _SPEAK_ID = 1
+    _STOP_ID = 2
 
     def __init__(self, on_speak, on_stop, debouncer: HotkeyDebouncer):
-        self._listener: Optional[keyboard.GlobalHotKeys] = None
+        self._hotkey_refs: list[ctypes.c_void_p] = []
+        self._handler_ref: Optional[ctypes.c_void_p] = None
+        self._handler = EventHandlerProc(self._handle_event)  # keep alive for Carbon
         self._on_speak = on_speak
         self._on_stop = on_stop
         self._debouncer = debouncer
 
     def start(self) -> None:
-        if self._listener is not None:
+        if self._hotkey_refs:
             return
-        self._listener = keyboard.GlobalHotKeys({
-            '<cmd>+<shift>+s': self._wrapped_speak,
-            '<cmd>+<shift>+x': self._on_stop,
-        })
-        self._listener.start()
-        print('[hotkeys] Enabled')
+        target = _carbon.GetApplicationEventTarget()
+        if self._handler_ref is None:
+            spec = EventTypeSpec(kEventClassKeyboard, kEventHotKeyPressed)
+            ref = ctypes.c_void_p()
+            status = _carbon.InstallEventHandler(target, self._handler, 1, ctypes.byref(spec), None, ctypes.byref(ref))
+            if status != noErr:
+                print(f"[error] Could not install hotkey handler (OSStatus {status})")
+                return
+            self._handler_ref = ref
+        for hotkey_id, (keycode, modifiers) in ((self._SPEAK_ID, SPEAK_HOTKEY), (self._STOP_ID, STOP_HOTKEY)):
+            ref = ctypes.c_void_p()
+            status = _carbon.RegisterEventHotKey(
+                keycode, modifiers, EventHotKeyID(HOTKEY_SIGNATURE, hotkey_id), target, 0, ctypes.byref(ref)
+            )
+            if status != noErr:
+                print(f"[error] Could not register hotkey {hotkey_id} (OSStatus {status})")
+                continue
+            self._hotkey_refs.append(ref)
+        if self._hotkey_refs:
+            print('[hotkeys] Enabled')
 
     def stop(self) -> None:
-        if self._listener is not None:
-            self._listener.stop()
-            self._listener = None
+        if self._hotkey_refs:
+            for ref in self._hotkey_refs:
+                _carbon.UnregisterEventHotKey(ref)
+            self._hotkey_refs = []
             print('[hotkeys] Disabled')
 
+    def _handle_event(self, _call_ref, event, _user_data) -> int:
+        hotkey = EventHotKeyID()
+        status = _carbon.GetEventParameter(
+            event, kEventParamDirectObject, typeEventHotKeyID, None,
+            ctypes.sizeof(hotkey), None, ctypes.byref(hotkey),
+        )
+        if status != noErr or hotkey.signature != HOTKEY_SIGNATURE:
+            return eventNotHandledErr
+        if hotkey.id == self._SPEAK_ID:
+            self._wrapped_speak()
+        elif hotkey.id == self._STOP_ID:
+            self._on_stop()
+        else:
+            return eventNotHandledErr
+        return noErr
+
     def _wrapped_speak(self):
         if self._debouncer.ok():
             self._on_speak()
 
 
+class SpeakService(NSObject):
+    """macOS Services provider: the frontmost app hands over the selection on a pasteboard.
+
+    Declared under NSServices in setup.py's PLIST, so it only exists in the .app bundle.
+    """
+
+    def initWithHandler_(self, handler):
+        self = objc.super(SpeakService, self).init()
+        if self is None:
+            return None
+        self._handler = handler
+        return self
+
+    @objc.typedSelector(b"v@:@@o^@")
+    def speakSelection_userData_error_(self, pboard, _user_data, _error):
+        self._handler((pboard.stringForType_(NSPasteboardTypeString) or "").strip())
+        return None
+
+
 class Read4MeMenuApp(rumps.App):
     """Menu bar controller for read4me."""
 
     def __init__(self) -> None:
         super().__init__(APP_TITLE_ENABLED)
         self.speaker = TextSpeaker(rate_wpm=DEFAULT_RATE_WPM, voice=DEFAULT_VOICE)
-        self.reader = SelectionReader(copy_delay_sec=COPY_DELAY_SEC)
+        self.reader = SelectionReader(copy_delay_sec=COPY_DELAY_SEC, restore_clipboard=RESTORE_CLIPBOARD)
         self.debounce = HotkeyDebouncer(0.5)
-        self.hotkeys = HotkeyService(self._speak_selection, self._stop_speaking, self.debounce)
+        self.hotkeys = HotkeyService(self._queue_speak, self._queue_stop, self.debounce)
+
+        # Hotkey callbacks run on the main run loop and must return quickly,
+        # so the actual clipboard/speech work runs on a worker thread.
+        self._jobs: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run_jobs, name="read4me-worker", daemon=True)
+        self._worker.start()
+
+        # "Speak with read4me" in the Services menu gets the selection without Cmd+C
+        self.service = SpeakService.alloc().initWithHandler_(self._queue_speak_text)
+        NSApplication.sharedApplication().setServicesProvider_(self.service)
 
         self.perms_item = rumps.MenuItem("Grant Accessibility Permission", callback=self._request_accessibility)
 
@@ -262,10 +525,33 @@ class Read4MeMenuApp(rumps.App):
         self.hotkeys.start()
         self.title = APP_TITLE_ENABLED
 
+    # ---- Worker ----
+    def _run_jobs(self) -> None:
+        while True:
+            job = self._jobs.get()
+            try:
+                # Long-lived thread: drain autoreleased Objective-C objects per job
+                with objc.autorelease_pool():
+                    job()
+            except Exception as e:
+                print(f"[error] {e}")
+            finally:
+                self._jobs.task_done()
+
+    def _queue_speak(self) -> None:
+        self._jobs.put(self._speak_selection)
+
+    def _queue_speak_text(self, text: str) -> None:
+        self._jobs.put(lambda: self.speaker.speak(text))
+
+    def _queue_stop(self) -> None:
+        self._jobs.put(self._stop_speaking)
+
     # ---- Actions ----
     def _speak_selection(self, *_):
         if not is_accessibility_trusted(prompt=False):
-            rumps.notification(
+            AppHelper.callAfter(
+                rumps.notification,
                 "read4me",
                 "Accessibility required",
                 "Enable in Settings → Privacy & Security → Accessibility (then try again)"
@@ -273,8 +559,8 @@ class Read4MeMenuApp(rumps.App):
             return
 
         text = self.reader.copy_selection_to_clipboard()
-        if not text.strip():
-            rumps.notification("read4me", "No text captured", "Select text and try again. If it repeats, enable Accessibility for read4me.")
+        if not text:
+            AppHelper.callAfter(rumps.notification, "read4me", "No text captured", "Select text and try again. If it repeats, enable Accessibility for read4me.")
             return
         self.speaker.speak(text)
 
@@ -293,6 +579,8 @@ class Read4MeMenuApp(rumps.App):
             self.title = APP_TITLE_DISABLED
 
     def _open_docs(self, *_):
+        import webbrowser
+
         try:
             webbrowser.open(DOCS_URL)
         except Exception as e: